@@ -1,4 +1,5 @@
 # coding:utf-8
+import os
 from enum import Enum
 
 from PyQt5.QtCore import QLocale
@@ -75,6 +76,11 @@ class Config(QConfig):
         EnumSerializer(TranscribeLanguageEnum)
     )
 
+    # 批量处理时同时运行的任务数，最多使用一半的 CPU 核心
+    batch_concurrency = RangeConfigItem(
+        "Transcribe", "BatchConcurrency", 1, RangeValidator(1, max(1, (os.cpu_count() or 2) // 2))
+    )
+
     # ------------------- Whisper Cpp 配置 -------------------
     whisper_model = OptionsConfigItem(
         "Whisper", "WhisperModel",
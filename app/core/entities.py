@@ -433,6 +433,7 @@ class VideoInfo:
     audio_codec: str
     audio_sampling_rate: int
     thumbnail_path: str
+    file_size_bytes: int = 0
 
 class WhisperModelEnum(Enum):
     TINY = "tiny"
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import requests
 import yt_dlp
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, QThread, pyqtSignal
 
 from ..entities import Task, TranscribeModelEnum, VideoInfo, LANGUAGES
 from ..utils.video_utils import get_video_info
@@ -15,6 +15,37 @@ from ...config import SUBTITLE_STYLE_PATH, APPDATA_PATH
 
 logger = setup_logger("create_task_thread")
 
+
+class WorkerSignals(QObject):
+    """QRunnable 不是 QObject，通过该对象把结果发回主线程"""
+    finished = pyqtSignal(Task)
+    error = pyqtSignal(str)
+
+
+class CreateTaskRunnable(QRunnable):
+    """在 QThreadPool 中创建任务，避免每个文件都启动一个新线程
+
+    signals 在主线程中创建，调用方需持有它直到结果送达，线程池释放 runnable 后排队的信号仍能投递。
+    """
+
+    def __init__(self, file_path, task_type: Task.Type):
+        super().__init__()
+        self.file_path = file_path
+        self.task_type = task_type
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            if self.task_type == Task.Type.TRANSCRIBE:
+                task = CreateTaskThread.build_transcription_task(self.file_path)
+            else:
+                task = CreateTaskThread.build_file_task(self.file_path)
+            self.signals.finished.emit(task)
+        except Exception as e:
+            logger.exception("创建任务失败: %s", str(e))
+            self.signals.error.emit(str(e))
+
+
 class CreateTaskThread(QThread):
     finished = pyqtSignal(Task)
     progress = pyqtSignal(int, str)
@@ -46,6 +77,13 @@ class CreateTaskThread(QThread):
             self.error.emit(str(e))
 
     def create_file_task(self, file_path):
+        task = self.build_file_task(file_path)
+        self.finished.emit(task)
+        self.progress.emit(100, self.tr("创建任务完成"))
+        logger.info(f"文件任务创建完成：{task}")
+
+    @staticmethod
+    def build_file_task(file_path) -> Task:
         logger.info("\n===================")
         logger.info(f"开始创建文件任务：{file_path}")
         # 使用 Path 对象处理路径
@@ -56,7 +94,7 @@ class CreateTaskThread(QThread):
         # 获取 视频/音频 信息
         thumbnail_path = str(task_work_dir / "thumbnail.jpg")
         video_info = get_video_info(file_path, thumbnail_path=thumbnail_path)
-        video_info = VideoInfo(**video_info)
+        video_info = VideoInfo(**video_info, file_size_bytes=os.path.getsize(file_path))
 
         # Philip: If need translation, no need to do subtitle fix
         # Translation should have priority over fixing.
@@ -103,7 +141,7 @@ class CreateTaskThread(QThread):
             status=Task.Status.PENDING,
             fraction_downloaded=0,
             work_dir=str(task_work_dir),
-            file_path=str(Path(self.file_path)),
+            file_path=str(Path(file_path)),
             url="",
             source=Task.Source.FILE_IMPORT,
             original_language=cfg.transcribe_language,
@@ -147,9 +185,7 @@ class CreateTaskThread(QThread):
             need_video=cfg.need_video.value,
             type=Task.Type.SUBTITLE,
         )
-        self.finished.emit(task)
-        self.progress.emit(100, self.tr("创建任务完成"))
-        logger.info(f"文件任务创建完成：{task}")
+        return task
 
     def create_url_task(self, url):
         logger.info("\n===================")
@@ -170,7 +206,8 @@ class CreateTaskThread(QThread):
             video_codec=info_dict.get('vcodec', ''),
             audio_codec=info_dict.get('acodec', ''),
             audio_sampling_rate=info_dict.get('asr', 0),
-            thumbnail_path=thumbnail_file_path
+            thumbnail_path=thumbnail_file_path,
+            file_size_bytes=os.path.getsize(video_file_path) if video_file_path else 0
         )
 
         # 使用 Path 对象处理路径
@@ -268,6 +305,12 @@ class CreateTaskThread(QThread):
         logger.info(f"URL任务创建完成：{task}")
 
     def create_transcription_task(self, file_path):
+        task = self.build_transcription_task(file_path)
+        self.finished.emit(task)
+        logger.info(f"转录任务创建完成：{task}")
+
+    @staticmethod
+    def build_transcription_task(file_path) -> Task:
         logger.info(f"开始创建转录任务：{file_path}")
         # task_work_dir = Path(file_path).parent
         
@@ -277,7 +320,7 @@ class CreateTaskThread(QThread):
         thumbnail_path = task_work_dir / "thumbnail.jpg"
 
         video_info = get_video_info(file_path, thumbnail_path=str(thumbnail_path))
-        video_info = VideoInfo(**video_info)
+        video_info = VideoInfo(**video_info, file_size_bytes=os.path.getsize(file_path))
 
         # 定义各个路径        
         if cfg.transcribe_model.value == TranscribeModelEnum.WHISPER:
@@ -302,7 +345,7 @@ class CreateTaskThread(QThread):
             status=Task.Status.PENDING,
             fraction_downloaded=0,
             work_dir=str(task_work_dir),
-            file_path=str(Path(self.file_path)),
+            file_path=str(Path(file_path)),
             url="",
             source=Task.Source.FILE_IMPORT,
             original_language=cfg.transcribe_language.value,
@@ -336,8 +379,7 @@ class CreateTaskThread(QThread):
             type=Task.Type.TRANSCRIBE,  # Transcribe only, no video generation.
             # End add
         )
-        self.finished.emit(task)
-        logger.info(f"转录任务创建完成：{task}")
+        return task
 
     def create_subtitle_optimization_task(file_path):
         logger.info(f"开始创建字幕优化任务：{file_path}")
@@ -0,0 +1,29 @@
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from ..bk_asr.ASRData import from_subtitle_file
+from ..utils.logger import setup_logger
+
+logger = setup_logger("subtitle_load_thread")
+
+
+class SubtitleLoadSignals(QObject):
+    """QRunnable 不是 QObject，通过该对象把解析结果发回主线程"""
+    finished = pyqtSignal(str, object)  # 文件路径, ASRData
+    error = pyqtSignal(str, str)  # 文件路径, 错误信息
+
+
+class SubtitleLoadRunnable(QRunnable):
+    """在线程池中解析字幕文件，避免大文件阻塞界面线程"""
+
+    def __init__(self, file_path: str):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = SubtitleLoadSignals()
+
+    def run(self):
+        try:
+            asr_data = from_subtitle_file(self.file_path)
+            self.signals.finished.emit(self.file_path, asr_data)
+        except Exception as e:
+            logger.exception("加载字幕文件失败: %s", str(e))
+            self.signals.error.emit(self.file_path, str(e))
@@ -4,7 +4,7 @@ from pathlib import Path
 import time
 from typing import Dict
 
-from PyQt5.QtCore import QThread, pyqtSignal, QSettings
+from PyQt5.QtCore import QAtomicInt, QThread, pyqtSignal, QSettings
 
 from ..subtitle_processor.optimizer import SubtitleOptimizer
 from ..subtitle_processor.summarizer import SubtitleSummarizer
@@ -41,15 +41,37 @@ class SubtitleOptimizationThread(QThread):
     update = pyqtSignal(dict)
     update_all = pyqtSignal(dict)
     error = pyqtSignal(str)
+    cancelled = pyqtSignal()
     MAX_DAILY_LLM_CALLS = 50
 
-    def __init__(self, task: Task):
+    def __init__(self, task: Task = None):
         super().__init__()
+        self.custom_prompt_text = ""
+        self.llm_result_logger = None
+        self._cancel = QAtomicInt(0)
+        # 每次 set_task 递增，用于识别上一次运行遗留的线程池回调
+        self._generation = 0
+        self.set_task(task)
+
+    def set_task(self, task: Task):
+        """设置新任务并重置进度，线程结束后可复用同一实例处理下一个任务"""
         self.task: Task = task
+        self._generation += 1
         self.subtitle_length = 0
         self.finished_subtitle_length = 0
-        self.custom_prompt_text = ""
-        self.llm_result_logger = None
+        self._last_progress_time = 0.0
+        self.optimizer = None
+        self._cancel.storeRelease(0)
+
+    def request_cancel(self):
+        """请求取消，线程在下一个阶段边界退出并发出 cancelled 信号"""
+        self._cancel.storeRelease(1)
+        # 未开始的批次直接取消，正在进行的请求结束后结果会被丢弃
+        if self.optimizer:
+            self.optimizer.stop()
+
+    def is_cancelled(self):
+        return self._cancel.loadAcquire() != 0
 
     def set_custom_prompt_text(self, text: str):
         self.custom_prompt_text = text
@@ -76,6 +98,8 @@ class SubtitleOptimizationThread(QThread):
         raise Exception(self.tr("自带的API配置暂时不可用，请配置自己的大模型API"))
 
     def run(self):
+        generation = self._generation
+        callback = lambda result: self.callback(result, generation)
         try:
             logger.info(f"\n===========字幕优化任务开始===========")
             logger.info(f"时间：{datetime.datetime.now()}")
@@ -83,6 +107,8 @@ class SubtitleOptimizationThread(QThread):
             # 获取API配置
             self.progress.emit(2, self.tr("开始验证API配置..."))
             base_url, api_key, llm_model, thread_num, batch_size = self._setup_api_config()
+            if self.is_cancelled():
+                return self._on_cancelled()
             logger.info(f"使用 {llm_model} 作为LLM模型")
             os.environ['OPENAI_BASE_URL'] = base_url
             os.environ['OPENAI_API_KEY'] = api_key
@@ -127,6 +153,8 @@ class SubtitleOptimizationThread(QThread):
                                           max_word_count_cjk=max_word_count_cjk, 
                                           max_word_count_english=max_word_count_english)
                 asr_data.save(save_path=split_path)
+                if self.is_cancelled():
+                    return self._on_cancelled()
                 self.update_all.emit(asr_data.to_json())
 
             # 制作成请求llm接口的格式 {{"1": "original_subtitle"},...}
@@ -139,6 +167,8 @@ class SubtitleOptimizationThread(QThread):
                     summarizer = SubtitleSummarizer(model=llm_model)
                     summarize_result = summarizer.summarize(asr_data.to_txt())
                 logger.info(f"总结字幕内容:{summarize_result}")
+                if self.is_cancelled():
+                    return self._on_cancelled()
                 
                 if need_translate:
                     self.progress.emit(30, self.tr("优化+翻译..."))
@@ -156,13 +186,16 @@ class SubtitleOptimizationThread(QThread):
                     )
                     optimizer_result = self.optimizer.optimizer_multi_thread(subtitle_json, translate=True,
                                                                              reflect=need_reflect,
-                                                                             callback=self.callback)
+                                                                             callback=callback)
                 elif need_optimize:
                     self.progress.emit(30, self.tr("优化字幕..."))
                     logger.info("正在优化字幕...")
                     self.optimizer = SubtitleOptimizer(summary_content=summarize_result, model=llm_model,
                                                        batch_num=batch_size, thread_num=thread_num, llm_result_logger=self.llm_result_logger)
-                    optimizer_result = self.optimizer.optimizer_multi_thread(subtitle_json, callback=self.callback)
+                    optimizer_result = self.optimizer.optimizer_multi_thread(subtitle_json, callback=callback)
+
+                if self.is_cancelled():
+                    return self._on_cancelled()
 
                 # 替换优化或者翻译后的字幕
                 for i, subtitle_text in optimizer_result.items():
@@ -196,6 +229,9 @@ class SubtitleOptimizationThread(QThread):
             logger.info("优化完成")
             self.finished.emit(self.task)
         except Exception as e:
+            # 取消时线程池中未执行的批次会抛出异常，不视为失败
+            if self.is_cancelled():
+                return self._on_cancelled()
             logger.exception(f"优化失败: {str(e)}")
             self.error.emit(str(e))
             self.progress.emit(100, self.tr("优化失败"))
@@ -221,13 +257,34 @@ class SubtitleOptimizationThread(QThread):
         print(self.settings.value('llm/daily_calls', 0))
         return True
 
-    def callback(self, result: Dict):
+    def _on_cancelled(self):
+        logger.info("字幕优化已取消")
+        self.cancelled.emit()
+
+    def callback(self, result: Dict, generation: int = None):
+        # 取消后或已切换到下一个任务时，线程池中仍在进行的请求结果直接丢弃
+        if self.is_cancelled() or (generation is not None and generation != self._generation):
+            return
         self.finished_subtitle_length += len(result)
         progress_num = int((self.finished_subtitle_length / self.subtitle_length) * 70) + 30
-        self.progress.emit(progress_num, self.tr("{0}% 处理字幕").format(progress_num))
+        # 进度最多每 50ms 发送一次，字幕内容的更新由界面端合并
+        now = time.monotonic()
+        if now - self._last_progress_time >= 0.05 or self.finished_subtitle_length >= self.subtitle_length:
+            self._last_progress_time = now
+            self.progress.emit(progress_num, self.tr("{0}% 处理字幕").format(progress_num))
         self.update.emit(result)
 
     def stop(self):
-        if hasattr(self, 'optimizer'):
-            self.optimizer.stop()
-        self.terminate()
\ No newline at end of file
+        """强制停止：取消并等待线程退出，超时后强制结束
+
+        与 request_cancel 不同，停止期间屏蔽信号，不会发出 cancelled 等信号。
+        停止前已排队、尚未送达的信号不受影响，需由接收方在复用线程前丢弃。
+        """
+        self.blockSignals(True)
+        try:
+            self.request_cancel()
+            if not self.wait(3000):
+                self.terminate()
+                self.wait()
+        finally:
+            self.blockSignals(False)
\ No newline at end of file
@@ -1,5 +1,5 @@
 import datetime
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QAtomicInt, QThread, pyqtSignal
 
 from .subtitle_optimization_thread import SubtitleOptimizationThread
 from .transcript_thread import TranscriptThread
@@ -23,6 +23,18 @@ class SubtitlePipelineThread(QThread):
         super().__init__()
         self.task = task
         self.has_error = False
+        self._cancel = QAtomicInt(0)
+        self._current_step = None
+
+    def request_cancel(self):
+        """请求取消，流程在下一个阶段边界退出"""
+        self._cancel.storeRelease(1)
+        step = self._current_step
+        if step is not None and hasattr(step, 'request_cancel'):
+            step.request_cancel()
+
+    def is_cancelled(self):
+        return self._cancel.loadAcquire() != 0
 
     def run(self):
         try:
@@ -40,11 +52,15 @@ class SubtitlePipelineThread(QThread):
             transcript_thread = TranscriptThread(self.task)
             transcript_thread.progress.connect(lambda value, msg: self.progress.emit(int(value * 0.4), msg))
             transcript_thread.error.connect(handle_error)
+            self._current_step = transcript_thread
             transcript_thread.run()
 
             if self.has_error:
                 logger.info("转录过程中发生错误，终止流程")
                 return
+            if self.is_cancelled():
+                logger.info("任务已取消，终止流程")
+                return
 
             # 2. 字幕优化/翻译
             # self.task.status = Task.Status.OPTIMIZING
@@ -53,11 +69,15 @@ class SubtitlePipelineThread(QThread):
                 optimization_thread = SubtitleOptimizationThread(self.task)
                 optimization_thread.progress.connect(lambda value, msg: self.progress.emit(int(40 + value * 0.2), msg))
                 optimization_thread.error.connect(handle_error)
+                self._current_step = optimization_thread
                 optimization_thread.run()
 
                 if self.has_error:
                     logger.info("字幕优化过程中发生错误，终止流程")
                     return
+                if self.is_cancelled():
+                    logger.info("任务已取消，终止流程")
+                    return
 
             # 3. 视频合成
             # self.task.status = Task.Status.GENERATING
@@ -65,6 +85,7 @@ class SubtitlePipelineThread(QThread):
             synthesis_thread = VideoSynthesisThread(self.task)
             synthesis_thread.progress.connect(lambda value, msg: self.progress.emit(int(70 + value * 0.3), msg))
             synthesis_thread.error.connect(handle_error)
+            self._current_step = synthesis_thread
             synthesis_thread.run()
 
             if self.has_error:
@@ -1,7 +1,7 @@
 import datetime
 from pathlib import Path
 
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QAtomicInt, QThread, pyqtSignal
 
 from ..bk_asr import (
     JianYingASR,
@@ -19,6 +19,11 @@ from ...common.config import cfg
 
 logger = setup_logger("transcript_thread")
 
+
+class TranscriptCancelled(Exception):
+    """转录被取消，用于从 ASR 的进度回调中跳出"""
+
+
 class TranscriptThread(QThread):
     finished = pyqtSignal(Task)
     progress = pyqtSignal(int, str)
@@ -36,6 +41,23 @@ class TranscriptThread(QThread):
     def __init__(self, task: Task):
         super().__init__()
         self.task = task
+        self.asr = None
+        self._cancel = QAtomicInt(0)
+
+    def request_cancel(self):
+        """请求取消，结束正在运行的转录子进程，线程随后退出"""
+        self._cancel.storeRelease(1)
+        # 本地 Whisper 在读取子进程输出时阻塞，结束子进程才能让读取循环返回
+        self._kill_asr_process()
+
+    def _kill_asr_process(self):
+        """结束仍在运行的 ASR 子进程（取消请求可能早于子进程启动）"""
+        process = getattr(self.asr, 'process', None)
+        if process is not None and process.poll() is None:
+            process.kill()
+
+    def is_cancelled(self):
+        return self._cancel.loadAcquire() != 0
 
     def run(self):
         try:
@@ -64,6 +86,10 @@ class TranscriptThread(QThread):
                 logger.error("音频转换失败")
                 raise RuntimeError(self.tr("音频转换失败"))
 
+            if self.is_cancelled():
+                logger.info("转录已取消")
+                return
+
             self.progress.emit(20, self.tr("语音转录中"))
             logger.info("开始语音转录")
 
@@ -132,6 +158,9 @@ class TranscriptThread(QThread):
                 raise ValueError(self.tr("无效的转录模型: ") + str(self.task.transcribe_model))
             
             asr_data = self.asr.run(callback=self.progress_callback)
+            if self.is_cancelled():
+                logger.info("转录已取消")
+                return
 
             # 保存字幕文件
             original_subtitle_path = Path(self.task.original_subtitle_save_path)
@@ -164,10 +193,19 @@ class TranscriptThread(QThread):
             self.progress.emit(100, self.tr("转录完成"))
             self.finished.emit(self.task)
         except Exception as e:
+            # 取消时 ASR 可能把回调抛出的异常包装后再抛出，不视为失败
+            if self.is_cancelled():
+                self._kill_asr_process()
+                logger.info("转录已取消")
+                return
             logger.exception("转录过程中发生错误: %s", str(e))
             self.error.emit(str(e))
             self.progress.emit(100, self.tr("转录失败"))
 
     def progress_callback(self, value, message):
+        if self.is_cancelled():
+            # 子进程可能在取消请求之后才启动，跳出读取循环前先结束它
+            self._kill_asr_process()
+            raise TranscriptCancelled()
         progress = min(20 + (value * 0.8), 100)
         self.progress.emit(int(progress), message)
@@ -1,12 +1,13 @@
 import datetime
 import os
+from collections import deque
 from pathlib import Path
 import subprocess
 import sys
 from threading import Lock
 
 from PyQt5.QtCore import *
-from PyQt5.QtGui import QPixmap, QFont
+from PyQt5.QtGui import QPixmap, QPixmapCache, QFont
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFileDialog, QMainWindow, QMessageBox
 from qfluentwidgets import ComboBox, CardWidget, ToolTipFilter, FluentWindow, isDarkTheme, \
     ToolTipPosition, PrimaryPushButton, PushButton, InfoBar, BodyLabel, PillPushButton, setFont, \
@@ -19,12 +20,27 @@ from ..config import RESOURCE_PATH
 from ..common.config import cfg
 from ..core.entities import SupportedVideoFormats, SupportedAudioFormats, TodoWhenDoneEnum
 from ..core.entities import Task, VideoInfo
-from ..core.thread.create_task_thread import CreateTaskThread
+from ..core.thread.create_task_thread import CreateTaskRunnable
 from ..core.thread.subtitle_pipeline_thread import SubtitlePipelineThread
 from ..core.thread.transcript_thread import TranscriptThread
 from ..view.subtitle_optimization_interface import SubtitleOptimizationInterface
 
 
+# 已结束（无需再处理）的任务状态
+TERMINAL_STATUSES = frozenset((Task.Status.COMPLETED, Task.Status.FAILED))
+
+# 样式表在程序运行期间不会变化，按主题缓存文件内容
+_QSS_CACHE: dict[str, str] = {}
+
+
+def _load_qss(theme: str) -> str:
+    """读取并缓存主题样式表"""
+    if theme not in _QSS_CACHE:
+        qss_path = RESOURCE_PATH / "assets" / "qss" / theme / "demo.qss"
+        _QSS_CACHE[theme] = qss_path.read_text(encoding="utf-8")
+    return _QSS_CACHE[theme]
+
+
 class timedMessageBox(QMessageBox):
     def __init__(self, title, message, timeout):
         super(timedMessageBox, self).__init__()
@@ -36,12 +52,19 @@ class timedMessageBox(QMessageBox):
         self.setDefaultButton = QMessageBox.StandardButton.Ok
 
     def showEvent(self, event):
-        QTimer().singleShot(self.timeout*1000, self.close)
+        QTimer.singleShot(self.timeout * 1000, self.close)
         super(timedMessageBox, self).showEvent(event)
 
 class BatchProcessInterface(QWidget):
     """批量处理界面"""
 
+    # 支持的格式只需计算一次
+    _VIDEO_FMTS = frozenset(fmt.value for fmt in SupportedVideoFormats)
+    _AUDIO_FMTS = frozenset(fmt.value for fmt in SupportedAudioFormats)
+    _AV_FMTS = _VIDEO_FMTS | _AUDIO_FMTS
+    _VIDEO_FILTER = " ".join(f"*.{fmt.value}" for fmt in SupportedVideoFormats)
+    _AV_FILTER = " ".join(f"*.{fmt.value}" for fmt in [*SupportedAudioFormats, *SupportedVideoFormats])
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("BatchProcessInterface")
@@ -50,9 +73,19 @@ class BatchProcessInterface(QWidget):
 
         self.tasks = []
         self.task_cards = []
+        self._task_paths: set[str] = set()  # 已添加文件的规范化路径，用于去重
+        self._pending: deque = deque()  # 待处理的任务卡片，按添加顺序
+        self._inflight: set = set()  # 批处理中已启动的任务卡片
+        self._active: set = set()  # 所有正在运行的任务卡片（含单独启动的）
+        self._ready_tasks = []  # 已创建、等待加入界面的任务
+        self._create_signals: set = set()  # 正在创建任务的信号对象，结果送达前保持引用
+        self._create_generation = 0  # 清空列表时递增，丢弃清空前发起的任务创建结果
         self.processing = False
         self.lock = Lock()
-        self.create_threads = []
+        # 创建任务主要是 ffprobe/IO，用固定大小的线程池复用线程
+        self.create_task_pool = QThreadPool(self)
+        self.create_task_pool.setMaxThreadCount(min(os.cpu_count() or 1, 4))
+        QPixmapCache.setCacheLimit(32 * 1024)  # KB，缓存缩放后的缩略图
         self.setup_ui()
         self._initStyle()
         self.setup_signals()
@@ -87,7 +120,8 @@ class BatchProcessInterface(QWidget):
         self.todo_when_done_label = BodyLabel(self.tr("全部处理后，就"))
         self.todo_when_done_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignCenter )
         self.todo_when_done_combobox = ComboBox(self)
-        self.todo_when_done_combobox.addItems([self.tr(todo.value) for todo in TodoWhenDoneEnum])
+        self._todo_enum_list = list(TodoWhenDoneEnum)
+        self.todo_when_done_combobox.addItems([self.tr(todo.value) for todo in self._todo_enum_list])
         self.todo_when_done_combobox.setCurrentIndex(0) # Defaults to do nothing.
         
         self.top_layout.addWidget(self.start_all_button)
@@ -140,9 +174,19 @@ class BatchProcessInterface(QWidget):
             )
             return
 
-        # 清空所有任务卡片
-        for task_card in self.task_cards[:]:
-            self.remove_task_card(task_card)
+        # 清空所有任务卡片，一次遍历完成，不在遍历中修改列表
+        for task_card in self.task_cards:
+            task_card.setParent(None)
+            task_card.deleteLater()
+        self.task_cards.clear()
+        self.tasks.clear()
+        self._task_paths.clear()
+        # 仍在创建或等待加入界面的任务一并丢弃
+        self._ready_tasks.clear()
+        self._create_generation += 1
+        self._pending.clear()
+        self._active.clear()
+        self.task_type_combo.setEnabled(True)
 
         InfoBar.success(
             self.tr("已清空"),
@@ -178,16 +222,11 @@ class BatchProcessInterface(QWidget):
             parent=self
         )
 
-        # 查找第一个未完成的任务并开始处理
-        for task_card in self.task_cards:
-            if task_card.task.status not in [Task.Status.COMPLETED, Task.Status.FAILED]:
-                task_card.finished.connect(self.on_task_finished)
-                task_card.error.connect(self.on_task_error)
-                task_card.start()
-                break
-        # 判断是否所有任务都已完成
-        if all(task_card.task.status in [Task.Status.COMPLETED, Task.Status.FAILED] for task_card in self.task_cards):
-            self.on_batch_finished()
+        # 按顺序排队所有未完成的任务，并在并发上限内开始处理
+        self._pending = deque(task_card for task_card in self.task_cards
+                              if task_card.task.status not in TERMINAL_STATUSES)
+        self._inflight.clear()
+        self._start_pending_tasks()
 
     def cancel_batch_process(self):
         """取消批量处理"""
@@ -196,12 +235,16 @@ class BatchProcessInterface(QWidget):
         self.cancel_button.setEnabled(False)
         self.add_file_button.setEnabled(True)
         self.clear_all_button.setEnabled(True)
+        self._pending.clear()
+        self._inflight.clear()
 
-        # 停止所有正在运行的任务
-        for task_card in self.task_cards:
-            if task_card.task.status in [Task.Status.TRANSCRIBING, Task.Status.PENDING, Task.Status.OPTIMIZING,
-                                         Task.Status.GENERATING]:
-                task_card.stop()
+        # 先向所有任务发出取消请求，再逐个等待，各任务的退出等待相互重叠
+        # （stop 会修改 _active，先复制）
+        task_cards = list(self._active)
+        for task_card in task_cards:
+            task_card.request_cancel()
+        for task_card in task_cards:
+            task_card.stop()
 
         # 显示取消处理的通知
         InfoBar.warning(
@@ -214,6 +257,9 @@ class BatchProcessInterface(QWidget):
 
     def on_task_finished(self, task):
         """单个任务完成的处理"""
+        # 不在批处理中时（单独启动/取消任务卡片）不调度下一个任务
+        if not self.processing:
+            return
         InfoBar.success(
             self.tr("任务完成"),
             self.tr("任务已完成"),
@@ -222,75 +268,69 @@ class BatchProcessInterface(QWidget):
             parent=self
         )
 
-        # 查找下一个未完成的任务
-        next_task = None
-        for task_card in self.task_cards:
-            if task_card.task.status not in [Task.Status.COMPLETED, Task.Status.FAILED]:
-                next_task = task_card
-                break
-
-        if next_task:
-            next_task.finished.connect(self.on_task_finished)
-            next_task.start()
-        else:
-            # 所有任务都完成了
-            self.on_batch_finished()
+        self._inflight.discard(self.sender())
+        self._start_pending_tasks()
 
     def on_task_error(self, error):
         """单个任务出错"""
+        if not self.processing:
+            return
         InfoBar.error(
             self.tr("任务出错"),
             self.tr("任务出错:") + error,
             duration=5000,
             parent=self
         )
-        # 查找下一个未完成的任务
-        next_task = None
-        for task_card in self.task_cards:
-            if task_card.task.status not in [Task.Status.COMPLETED, Task.Status.FAILED]:
-                next_task = task_card
-                break
+        self._inflight.discard(self.sender())
+        self._start_pending_tasks()
+    
+    def _start_pending_tasks(self):
+        """在并发上限内启动排队的任务，全部结束时完成批处理"""
+        while self._pending and len(self._inflight) < cfg.batch_concurrency.value:
+            task_card = self._pending.popleft()
+            # 排队期间可能已被单独启动并完成，start() 不会再发出结束信号
+            if task_card.task.status in TERMINAL_STATUSES:
+                continue
+            self._inflight.add(task_card)
+            task_card.start()
 
-        if next_task:
-            next_task.finished.connect(self.on_task_finished)
-            next_task.start()
-        else:
-            # 所有任务都完成了
+        # 所有任务都完成了
+        if self.processing and not self._pending and not self._inflight:
             self.on_batch_finished()
-    
+
     def on_batch_finished(self):
         """批量处理完成的处理"""
-        todo = self.todo_when_done_combobox.currentText()
-        match todo:
-            case self.tr(TodoWhenDoneEnum.EXIT):
-                QCoreApplication.quit() # Exit
-
-            case self.tr(TodoWhenDoneEnum.SUSPEND):
-                qbox = timedMessageBox(
-                    self.tr("Suspending in 1 minute"),
-                    self.tr("All jobs are done. The computer is going to be suspended."),
-                    60
-                )
-                ret = qbox.exec()
-                if ret == QMessageBox.StandardButton.Ok:
-                    if sys.platform == 'win32':
-                        os.system("rundll32.exe powrprof.dll,SetSuspendState 0,1,0")
-                    else:
-                        os.system('sudo systemctl suspend')
-
-            case self.tr(TodoWhenDoneEnum.SHUTDOWN):
-                qbox = timedMessageBox(
-                    self.tr( "Shutting Down in 1 minute"),
-                    self.tr("All jobs are done. The computer is shutting down. "),
-                    60
-                )
-                ret = qbox.exec()
-                if ret == QMessageBox.StandardButton.Ok:
-                    if sys.platform == 'win32':
-                        os.system("shutdown /s /t 1")
-                    else:
-                        self.stop()
-                        os.system('sudo shutdown now')
+        # 按下标取枚举，不依赖翻译后的文字
+        todo_enum = self._todo_enum_list[self.todo_when_done_combobox.currentIndex()]
+        if todo_enum is TodoWhenDoneEnum.EXIT:
+            QCoreApplication.quit() # Exit
+
+        elif todo_enum is TodoWhenDoneEnum.SUSPEND:
+            qbox = timedMessageBox(
+                self.tr("Suspending in 1 minute"),
+                self.tr("All jobs are done. The computer is going to be suspended."),
+                60
+            )
+            ret = qbox.exec()
+            if ret == QMessageBox.StandardButton.Ok:
+                if sys.platform == 'win32':
+                    os.system("rundll32.exe powrprof.dll,SetSuspendState 0,1,0")
+                else:
+                    os.system('sudo systemctl suspend')
+
+        elif todo_enum is TodoWhenDoneEnum.SHUTDOWN:
+            qbox = timedMessageBox(
+                self.tr( "Shutting Down in 1 minute"),
+                self.tr("All jobs are done. The computer is shutting down. "),
+                60
+            )
+            ret = qbox.exec()
+            if ret == QMessageBox.StandardButton.Ok:
+                if sys.platform == 'win32':
+                    os.system("shutdown /s /t 1")
+                else:
+                    self.stop()
+                    os.system('sudo shutdown now')
         
         # Doing nothing.
         self.processing = False
@@ -311,14 +351,12 @@ class BatchProcessInterface(QWidget):
     def on_add_file(self):
         """添加文件按钮点击事件"""
         # 构建文件过滤器字符串
-        video_formats = [f"*.{fmt.value}" for fmt in SupportedVideoFormats]
-        audio_formats = [f"*.{fmt.value}" for fmt in SupportedAudioFormats]
         if self.task_type_combo.currentText() == self.tr("视频加字幕"):
-            filter_str = f"{self.tr('视频文件')} ({' '.join(video_formats)})"
+            filter_str = f"{self.tr('视频文件')} ({self._VIDEO_FILTER})"
             task_type = Task.Type.SUBTITLE
         else:
             # 音频/视频生成字幕
-            filter_str = f"{self.tr('音频文件或视频文件')} ({' '.join(audio_formats + video_formats)})"
+            filter_str = f"{self.tr('音频文件或视频文件')} ({self._AV_FILTER})"
             task_type = Task.Type.TRANSCRIBE
 
         files, _ = QFileDialog.getOpenFileNames(self, self.tr("选择文件"), cfg.last_open_dir.value , filter_str)
@@ -333,51 +371,99 @@ class BatchProcessInterface(QWidget):
     def create_task(self, file_path, task_type: Task.Type):
         """创建新任务"""
         # 检查文件是否已存在
-        for task in self.tasks:
-            if Path(task.file_path).resolve() == Path(file_path).resolve():
-                InfoBar.warning(
-                    self.tr("添加失败"),
-                    self.tr("该文件已存在于任务列表中"),
-                    duration=3000,
-                    position=InfoBarPosition.BOTTOM,
-                    parent=self
-                )
-                return
+        key = self._path_key(file_path)
+        if key in self._task_paths:
+            InfoBar.warning(
+                self.tr("添加失败"),
+                self.tr("该文件已存在于任务列表中"),
+                duration=3000,
+                position=InfoBarPosition.BOTTOM,
+                parent=self
+            )
+            return
+        self._task_paths.add(key)
 
         # task_type = 'transcription' if self.task_type_combo.currentText() == self.tr("音视频转录") else 'file'
-        create_thread = CreateTaskThread(file_path, task_type)
-        create_thread.finished.connect(self.add_task_card)
-        create_thread.finished.connect(lambda: self.cleanup_thread(create_thread))
-        self.create_threads.append(create_thread)
-        create_thread.start()
-
-    def cleanup_thread(self, thread):
-        """清理完成的线程"""
-        if thread in self.create_threads:
-            self.create_threads.remove(thread)
-            thread.deleteLater()
+        create_runnable = CreateTaskRunnable(file_path, task_type)
+        signals = create_runnable.signals
+        generation = self._create_generation
+        # 持有信号对象直到结果送达，线程池会在 run() 返回后释放 runnable
+        self._create_signals.add(signals)
+        signals.finished.connect(lambda task: self._on_task_created(task, generation, signals))
+        # 创建失败时释放路径，允许重新添加
+        signals.error.connect(lambda _: self._on_create_task_error(key, generation, signals))
+        self.create_task_pool.start(create_runnable)
+
+    def _on_task_created(self, task: Task, generation, signals):
+        """任务创建完成，列表在此期间被清空时丢弃结果"""
+        self._create_signals.discard(signals)
+        if generation != self._create_generation:
+            return
+        self.add_task_card(task)
+
+    def _on_create_task_error(self, key, generation, signals):
+        """任务创建失败"""
+        self._create_signals.discard(signals)
+        # 清空后路径记录已重置，不能误删重新添加的同一文件
+        if generation == self._create_generation:
+            self._task_paths.discard(key)
+
+    @staticmethod
+    def _path_key(file_path) -> str:
+        """文件路径去重用的键"""
+        return os.path.normcase(os.path.realpath(file_path))
 
     def add_task_card(self, task: Task):
-        """添加新的任务卡片"""
-        task_card = TaskInfoCard(self)
-        task_card.set_task(task)
-        task_card.remove.connect(self.remove_task_card)
-        self.task_cards.append(task_card)
-        self.tasks.append(task)
-        self.scroll_layout.addWidget(task_card)
+        """添加新的任务卡片（合并同一轮事件循环内完成的任务，一次性加入布局）"""
+        if not self._ready_tasks:
+            QTimer.singleShot(0, self._flush_task_cards)
+        self._ready_tasks.append(task)
+
+    def _flush_task_cards(self):
+        """批量创建任务卡片，避免每张卡片都触发一次布局和重绘"""
+        tasks, self._ready_tasks = self._ready_tasks, []
+        if not tasks:
+            return
+
+        self.scroll_widget.setUpdatesEnabled(False)
+        try:
+            for task in tasks:
+                task_card = TaskInfoCard(self)
+                task_card.set_task(task)
+                task_card.remove.connect(self.remove_task_card)
+                self.task_cards.append(task_card)
+                task_card.finished.connect(self.on_task_finished, Qt.UniqueConnection)
+                task_card.error.connect(self.on_task_error, Qt.UniqueConnection)
+                task_card.active_changed.connect(self._on_card_active_changed)
+                self.tasks.append(task)
+                self.scroll_layout.addWidget(task_card)
+        finally:
+            self.scroll_widget.setUpdatesEnabled(True)
+        self.scroll_layout.activate()
 
         # 当有任务时禁用任务类型选择
         self.task_type_combo.setEnabled(False)
 
         # 显示成功提示
+        if len(tasks) == 1:
+            content = self.tr(f"已添加视频:") + tasks[0].video_info.file_name
+        else:
+            content = self.tr("已添加 {0} 个文件").format(len(tasks))
         InfoBar.success(
             self.tr("添加成功"),
-            self.tr(f"已添加视频:") + task.video_info.file_name,
+            content,
             duration=2000,
             position=InfoBarPosition.BOTTOM,
             parent=self
         )
 
+    def _on_card_active_changed(self, task_card, active: bool):
+        """记录正在运行的任务卡片"""
+        if active:
+            self._active.add(task_card)
+        else:
+            self._active.discard(task_card)
+
     def remove_task_card(self, task_card):
         """移除任务卡片"""
         if task_card in self.task_cards:
@@ -394,6 +480,8 @@ class BatchProcessInterface(QWidget):
 
             self.task_cards.remove(task_card)
             self.tasks.remove(task_card.task)
+            self._task_paths.discard(self._path_key(task_card.task.file_path))
+            self._active.discard(task_card)
             self.scroll_layout.removeWidget(task_card)
             task_card.deleteLater()
 
@@ -419,25 +507,25 @@ class BatchProcessInterface(QWidget):
 
     def dropEvent(self, event):
         """拖拽放下事件处理"""
+        # 根据任务类型确定支持的文件格式
+        if self.task_type_combo.currentText() == self.tr("视频加字幕"):
+            supported_formats = self._VIDEO_FMTS
+            task_type = Task.Type.SUBTITLE
+            error_msg = self.tr("请拖入视频文件")
+        else:
+            supported_formats = self._AV_FMTS
+            task_type = Task.Type.TRANSCRIBE
+            error_msg = self.tr("请拖入音频或视频文件")
+
         for url in event.mimeData().urls():
             file_path = url.toLocalFile()
             if not os.path.isfile(file_path):
                 continue
 
             file_ext = os.path.splitext(file_path)[1][1:].lower()
-
-            # 根据任务类型检查文件格式
-            if self.task_type_combo.currentText() == self.tr("视频加字幕"):
-                supported_formats = {fmt.value for fmt in SupportedVideoFormats}
-                task_type = Task.Type.SUBTITLE
-            else:
-                supported_formats = {fmt.value for fmt in SupportedVideoFormats} | {fmt.value for fmt in SupportedAudioFormats}
-                task_type = Task.Type.TRANSCRIBE
-
             if file_ext in supported_formats:
                 self.create_task(file_path, task_type)
             else:
-                error_msg = self.tr("请拖入视频文件") if self.task_type_combo.currentText() == self.tr("视频加字幕") else self.tr("请拖入音频或视频文件")
                 InfoBar.error(
                     self.tr(f"格式错误") + file_ext,
                     error_msg,
@@ -454,10 +542,20 @@ class TaskInfoCard(CardWidget):
     finished = pyqtSignal(Task)
     remove = pyqtSignal(object)
     error = pyqtSignal(str)
+    active_changed = pyqtSignal(object, bool)  # 任务卡片, 是否正在运行
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.task: Task = None
+        # tooltip 随进度频繁刷新，翻译后的标签只查一次
+        self._tt_model = self.tr("转录模型: ")
+        self._tt_file = self.tr("文件: ")
+        self._tt_strategy = self.tr("字幕策略: ")
+        self._tt_status = self.tr("任务状态: ")
+        self._tt_strategy_none = self.tr("无")
+        self._tt_strategy_optimize = self.tr("字幕优化")
+        self._tt_strategy_translate = self.tr("字幕翻译 ")
+        self._last_tooltip = None
         self.setup_ui()
         self.setup_signals()
         self.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -555,7 +653,7 @@ class TaskInfoCard(CardWidget):
         # self.video_title.setText(video_info.file_name.rsplit('.', 1)[0])
         self.video_title.setText(video_info.file_name + '\n' + video_info.file_path)
         self.resolution_info.setText(self.tr("画质: ") + f"{video_info.width}x{video_info.height}")
-        file_size_mb = os.path.getsize(self.task.file_path) / 1024 / 1024
+        file_size_mb = video_info.file_size_bytes / 1024 / 1024
         self.file_size_info.setText(self.tr("大小: ") + f"{file_size_mb:.1f} MB")
         duration = datetime.timedelta(seconds=int(video_info.duration_seconds))
         self.duration_info.setText(self.tr("时长: ") + str(duration))
@@ -566,30 +664,41 @@ class TaskInfoCard(CardWidget):
     def update_tooltip(self):
         """更新tooltip"""
         # 设置整体tooltip
-        strategy_text = self.tr("无")
+        strategy_text = self._tt_strategy_none
         if self.task.need_optimize:
-            strategy_text = self.tr("字幕优化")
+            strategy_text = self._tt_strategy_optimize
         elif self.task.need_translate:
             # strategy_text = self.tr("字幕优化+翻译 ") + str(self.task.target_language)
-            strategy_text = self.tr("字幕翻译 ") + str(self.task.target_language)
+            strategy_text = self._tt_strategy_translate + str(self.task.target_language)
 
-        tooltip = self.tr("转录模型: ") + self.task.transcribe_model.value + "\n"
-        tooltip += self.tr("文件: ") + self.task.file_path + '\n'
+        parts = [self._tt_model, self.task.transcribe_model.value, "\n",
+                 self._tt_file, self.task.file_path, "\n"]
         if self.task.status == Task.Status.PENDING:
-            tooltip += self.tr("字幕策略: ") + strategy_text + "\n"
-        tooltip += self.tr("任务状态: ") + self.task.status.value
-        self.setToolTip(tooltip)
+            parts += [self._tt_strategy, strategy_text, "\n"]
+        parts += [self._tt_status, self.task.status.value]
+        tooltip = "".join(parts)
+        # 内容未变化时不重复设置，避免 Qt 内部的 tooltip 变更处理
+        if tooltip != self._last_tooltip:
+            self._last_tooltip = tooltip
+            self.setToolTip(tooltip)
 
     def update_thumbnail(self, thumbnail_path):
         """更新视频缩略图"""
-        if not Path(thumbnail_path).exists():
-            thumbnail_path = RESOURCE_PATH / "assets" / "audio-thumbnail.png"
-
-        pixmap = QPixmap(str(thumbnail_path)).scaled(
-            self.video_thumbnail.size(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+        size = self.video_thumbnail.size()
+        if Path(thumbnail_path).exists():
+            # 视频帧每个任务各不相同（同名文件的缩略图路径也相同），不缓存；缩成小图时快速缩放看不出差别
+            pixmap = QPixmap(str(thumbnail_path)).scaled(size, Qt.KeepAspectRatio, Qt.FastTransformation)
+        else:
+            # 所有音频任务共用默认图标，只解码缩放一次
+            cache_key = f"audio-thumbnail:{size.width()}x{size.height()}"
+            pixmap = QPixmapCache.find(cache_key)
+            if pixmap is None or pixmap.isNull():
+                pixmap = QPixmap(str(RESOURCE_PATH / "assets" / "audio-thumbnail.png")).scaled(
+                    size,
+                    Qt.KeepAspectRatio,
+                    Qt.SmoothTransformation
+                )
+                QPixmapCache.insert(cache_key, pixmap)
         self.video_thumbnail.setPixmap(pixmap)
 
     def setup_signals(self):
@@ -644,8 +753,7 @@ class TaskInfoCard(CardWidget):
             self.subtitle_window.resize(1000, 800)
 
             theme = 'dark' if isDarkTheme() else 'light'
-            with open(RESOURCE_PATH / "assets" / "qss" / theme / "demo.qss", encoding='utf-8') as f:
-                self.subtitle_window.setStyleSheet(f.read())
+            self.subtitle_window.setStyleSheet(_load_qss(theme))
             self.subtitle_window.show()
         else:
             InfoBar.warning(
@@ -662,12 +770,19 @@ class TaskInfoCard(CardWidget):
         self.finished.emit(self.task)
         self.update_tooltip()
 
+    def request_cancel(self):
+        """请求正在运行的线程自行退出，不等待"""
+        for thread in (self.transcript_thread, self.subtitle_thread):
+            if thread and thread.isRunning():
+                thread.request_cancel()
+
     def stop(self):
         """停止转录"""
-        if self.transcript_thread and self.transcript_thread.isRunning():
-            self.transcript_thread.terminate()
-        if self.subtitle_thread and self.subtitle_thread.isRunning():
-            self.subtitle_thread.terminate()
+        # 先请求线程自行退出，超时后才强制终止
+        self.request_cancel()
+        for thread in (self.transcript_thread, self.subtitle_thread):
+            if thread and thread.isRunning() and not thread.wait(3000):
+                thread.terminate()
         self.reset_ui()
         InfoBar.success(
             self.tr("已取消"),
@@ -688,6 +803,7 @@ class TaskInfoCard(CardWidget):
             )
             return
 
+        self.active_changed.emit(self, True)
         self.progress_ring.show()
         self.progress_ring.setValue(100)
         # self.start_button.setDisabled(True)
@@ -715,12 +831,14 @@ class TaskInfoCard(CardWidget):
     def on_open_folder_clicked(self):
         """打开文件夹按钮点击事件"""
         if self.task and Path(self.task.file_path).exists():
+            folder = str(Path(self.task.file_path).parent)
             if sys.platform == "win32":
-                os.startfile(str( Path(self.task.file_path).parent) )
-            elif sys.platform == "darwin":  # macOS
-                subprocess.run(["open", str( Path(self.task.file_path).parent) ])
-            else:  # Linux
-                subprocess.run(["xdg-open", str( Path(self.task.file_path).parent) ])
+                os.startfile(folder)
+            else:
+                # 不等待文件管理器返回，避免阻塞界面线程
+                opener = "open" if sys.platform == "darwin" else "xdg-open"  # macOS / Linux
+                subprocess.Popen([opener, folder], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                 start_new_session=True)
         else:
             InfoBar.warning(
                 self.tr("警告"),
@@ -771,6 +889,7 @@ class TaskInfoCard(CardWidget):
         self.task_state.setLevel(InfoLevel.INFOAMTION)
         self.task_state.setIcon(FIF.REMOVE)
         self.update_tooltip()
+        self.active_changed.emit(self, False)
 
     def set_task(self, task):
         """设置任务并更新UI"""
@@ -101,6 +101,14 @@ class SettingInterface(ScrollArea):
             parent=self.llmGroup
         )
 
+        self.batchConcurrencyCard = RangeSettingCard(
+            cfg.batch_concurrency,
+            FIF.SPEED_HIGH,
+            self.tr('批量处理并发数'),
+            self.tr('批量处理时同时运行的任务数，本地模型会占用更多显存'),
+            parent=self.transcribeGroup
+        )
+
         # 翻译与优化配置
         self.translateGroup = SettingCardGroup(self.tr("翻译与优化"), self.scrollWidget)
         self.subtitleCorrectCard = SwitchSettingCard(
@@ -275,6 +283,7 @@ class SettingInterface(ScrollArea):
         # 添加卡片到组
         self.transcribeGroup.addSettingCard(self.transcribeModelCard)
         self.transcribeGroup.addSettingCard(self.whisperSettingCard)
+        self.transcribeGroup.addSettingCard(self.batchConcurrencyCard)
 
         self.llmGroup.addSettingCard(self.apiKeyCard)
         self.llmGroup.addSettingCard(self.apiBaseCard)
@@ -1,14 +1,16 @@
 # -*- coding: utf-8 -*-
 import os
+import re
 import sys
 import subprocess
 from pathlib import Path
 from collections import deque
+from itertools import groupby
 import tempfile
 
 from PyQt5.QtCore import *
-from PyQt5.QtGui import QDragEnterEvent, QDropEvent, QColor
-from PyQt5.QtWidgets import QAbstractItemView
+from PyQt5.QtGui import QDragEnterEvent, QDropEvent, QColor, QKeySequence
+from PyQt5.QtWidgets import QAbstractItemView, QShortcut
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QApplication, QHeaderView, QFileDialog, QMessageBox
 from qfluentwidgets import ComboBox, PrimaryPushButton, ProgressBar, PushButton, InfoBar, BodyLabel, TableView, ToolButton, TextEdit, MessageBoxBase, RoundMenu, Action, FluentIcon as FIF
 from qfluentwidgets import InfoBarPosition
@@ -18,21 +20,63 @@ from app.config import SUBTITLE_STYLE_PATH
 
 from ..core.thread.subtitle_optimization_thread import SubtitleOptimizationThread
 from ..common.config import cfg
-from ..core.bk_asr.ASRData import from_subtitle_file, from_json
+from ..core.bk_asr.ASRData import ASRData, ASRDataSeg, from_subtitle_file
 from ..core.entities import OutputSubtitleFormatEnum, SupportedSubtitleFormats
 from ..core.entities import Task
 from ..core.thread.create_task_thread import CreateTaskThread
+from ..core.thread.subtitle_load_thread import SubtitleLoadRunnable
 from ..common.signal_bus import signalBus
 from ..components.SubtitleSettingDialog import SubtitleSettingDialog
+from ..core.utils.logger import setup_logger
+
+logger = setup_logger("subtitle_optimization_interface")
+
+
+_TIME_RE = re.compile(r'(\d\d):(\d\d):(\d\d)\.(\d{3})')
+
+
+def _parse_hms_ms(value: str) -> int:
+    """hh:mm:ss.zzz 格式转换为毫秒，格式不符时交给 QTime 解析"""
+    if match := _TIME_RE.fullmatch(value.strip()):
+        h, m, s, ms = map(int, match.groups())
+        return h * 3600000 + m * 60000 + s * 1000 + ms
+    return QTime(0, 0, 0).msecsTo(QTime.fromString(value, 'hh:mm:ss.zzz'))
+
+
+def _format_ms(ms: int) -> str:
+    """毫秒转换为 hh:mm:ss.zzz 格式"""
+    seconds, ms = divmod(int(ms), 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{ms:03d}"
 
 
 class SubtitleTableModel(QAbstractTableModel):
     def __init__(self, data):
         super().__init__()
-        self._data = data
+        self._load(list(data.keys()), list(data.values()))
+
+    def _load(self, keys, rows):
+        """按行存储字幕，JSON 的键只在 _keys 中保留，用于匹配流式更新"""
+        self._keys = keys
+        self._rows = rows
+        self._key_index = {key: i for i, key in enumerate(self._keys)}
+        # 表格重绘时频繁读取时间列，预先格式化
+        self._time_strs = [[_format_ms(item['start_time']), _format_ms(item['end_time'])]
+                           for item in self._rows]
+
+    def to_asr_data(self) -> ASRData:
+        """按行顺序直接生成 ASRData，不经过 JSON 字典"""
+        segments = []
+        for item in self._rows:
+            text = item['original_subtitle']
+            if item['translated_subtitle']:
+                text += '\n' + item['translated_subtitle']
+            segments.append(ASRDataSeg(text, item['start_time'], item['end_time']))
+        return ASRData(segments)
 
     def rowCount(self, parent=None):
-        return len(self._data)
+        return len(self._rows)
 
     def columnCount(self, parent=None):
         return 4
@@ -41,11 +85,9 @@ class SubtitleTableModel(QAbstractTableModel):
         if role == Qt.DisplayRole or role == Qt.EditRole:
             row = index.row()
             col = index.column()
-            item = list(self._data.values())[row]
-            if col == 0:
-                return QTime(0, 0, 0).addMSecs(item['start_time']).toString('hh:mm:ss.zzz')
-            elif col == 1:
-                return QTime(0, 0, 0).addMSecs(item['end_time']).toString('hh:mm:ss.zzz')
+            item = self._rows[row]
+            if col == 0 or col == 1:
+                return self._time_strs[row][col]
             elif col == 2:
                 return item['original_subtitle']
             elif col == 3:
@@ -57,39 +99,77 @@ class SubtitleTableModel(QAbstractTableModel):
 
         # 更新内部数据
         for key, value in new_data.items():
-            if key in self._data:
-                if "\n" in value:
-                    original_subtitle, translated_subtitle = value.split("\n", 1)
-                    self._data[key]['original_subtitle'] = original_subtitle
-                    self._data[key]['translated_subtitle'] = translated_subtitle
+            row = self._key_index.get(key)
+            if row is not None:
+                item = self._rows[row]
+                original_subtitle, sep, translated_subtitle = value.partition("\n")
+                if sep:
+                    item['original_subtitle'] = original_subtitle
+                    item['translated_subtitle'] = translated_subtitle
                 else:
-                    self._data[key]['translated_subtitle'] = value
-                row = list(self._data.keys()).index(key)
+                    item['translated_subtitle'] = value
                 updated_rows.add(row)
 
-        # 如果有更新，发出dataChanged信号
-        if updated_rows:
-            min_row = min(updated_rows)
-            max_row = max(updated_rows)
-            top_left = self.index(min_row, 2)
-            bottom_right = self.index(max_row, 3)
-            self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole, Qt.EditRole])
+        # 按连续的行区间分别发出dataChanged信号，稀疏更新时不重绘中间未变化的行
+        for _, run in groupby(enumerate(sorted(updated_rows)), lambda p: p[1] - p[0]):
+            run = list(run)
+            top_left = self.index(run[0][1], 2)
+            bottom_right = self.index(run[-1][1], 3)
+            self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole])
 
     def update_all(self, data):
-        self._data = data
-        self.layoutChanged.emit()
+        # 行数不变时只刷新内容，保留视图的选中、滚动位置和编辑状态
+        if data and len(data) == len(self._rows):
+            self._load(list(data.keys()), list(data.values()))
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._rows) - 1, 3), [Qt.DisplayRole])
+            return
+        self.beginResetModel()
+        self._load(list(data.keys()), list(data.values()))
+        self.endResetModel()
+
+    def set_asr_data(self, asr_data: ASRData):
+        """直接从解析好的 ASRData 载入，省去 to_json 生成的中间字典"""
+        rows = []
+        for segment in asr_data.segments:
+            original_subtitle, _, translated_subtitle = segment.text.partition("\n")
+            rows.append({
+                "start_time": segment.start_time,
+                "end_time": segment.end_time,
+                "original_subtitle": original_subtitle,
+                "translated_subtitle": translated_subtitle
+            })
+        self.beginResetModel()
+        self._load([str(i) for i in range(1, len(rows) + 1)], rows)
+        self.endResetModel()
+
+    def merge_rows(self, first, last, merged_item):
+        """用 merged_item 替换第 first 到 last 行（含），只移动被删除行之后的索引"""
+        if last > first:
+            self.beginRemoveRows(QModelIndex(), first + 1, last)
+            for key in self._keys[first + 1:last + 1]:
+                del self._key_index[key]
+            del self._keys[first + 1:last + 1]
+            del self._rows[first + 1:last + 1]
+            del self._time_strs[first + 1:last + 1]
+            for i in range(first + 1, len(self._keys)):
+                self._key_index[self._keys[i]] = i
+            self.endRemoveRows()
+
+        self._rows[first] = merged_item
+        self._time_strs[first] = [_format_ms(merged_item['start_time']), _format_ms(merged_item['end_time'])]
+        self.dataChanged.emit(self.index(first, 0), self.index(first, 3), [Qt.DisplayRole])
 
     def setData(self, index, value, role):
         if role == Qt.EditRole:
             row = index.row()
             col = index.column()
-            item = list(self._data.values())[row]
+            item = self._rows[row]
             if col == 0:
-                time = QTime.fromString(value, 'hh:mm:ss.zzz')
-                item['start_time'] = QTime(0, 0, 0).msecsTo(time)
+                item['start_time'] = _parse_hms_ms(value)
+                self._time_strs[row][0] = _format_ms(item['start_time'])
             elif col == 1:
-                time = QTime.fromString(value, 'hh:mm:ss.zzz')
-                item['end_time'] = QTime(0, 0, 0).msecsTo(time)
+                item['end_time'] = _parse_hms_ms(value)
+                self._time_strs[row][1] = _format_ms(item['end_time'])
             elif col == 2:
                 item['original_subtitle'] = value
             elif col == 3:
@@ -137,6 +217,10 @@ class SubtitleOptimizationInterface(QWidget):
     """
     finished = pyqtSignal(Task)
 
+    # 支持的字幕格式及文件过滤器只需计算一次
+    _SUPPORTED_FORMATS = frozenset(fmt.value for fmt in SupportedSubtitleFormats)
+    _SUBTITLE_FILTER = " ".join(f"*.{fmt.value}" for fmt in SupportedSubtitleFormats)
+
     def __init__(self, parent=None):
         """
         初始化字幕优化界面
@@ -149,11 +233,35 @@ class SubtitleOptimizationInterface(QWidget):
         #改start
         self.file_queue = deque()  # 队列保存文件路径
         #改end
+        self._loading_file = None  # 正在后台解析的字幕文件
+        self._auto_start = False  # 解析完成后是否自动开始处理
+        self._notify_loaded = False  # 解析成功后是否提示导入成功（拖入文件时）
+        self._run_active = False  # 优化任务已开始且尚未收到结束信号
+        self._dropping_stale_events = False  # 正在丢弃已停止任务排队的信号
+        self._subtitle_debounce = None  # 预览字幕写入的防抖定时器，首次打开播放器时创建
+        self._prefetching = None  # 正在预解析的批量队列文件
+        self._prefetched = {}  # 已预解析的文件路径 -> ASRData
+        self._prompt_dialog = None  # 首次打开时创建，之后复用
+        # 取消流程中使用的提示文本
+        self._cancelling_text = self.tr("正在取消...")
+        self._cancelled_status = self.tr("已取消优化")
+        self._cancelled_title = self.tr("已取消")
+        self._cancelled_content = self.tr("字幕优化已取消")
+        self._cancel_infobar = None  # 正在显示的取消提示
+        # 流式更新先缓存，50ms 内的多次更新合并为一次刷新
+        self._pending_updates = {}
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(50)
+        self._update_timer.timeout.connect(self._flush_updates)
         self.setAcceptDrops(True)
         self.task = None
         self.custom_prompt_text = cfg.custom_prompt_text.value
+        # 有文稿提示时使用的绿色图标，只渲染一次
+        self._green_doc_icon = FIF.DOCUMENT.colored(QColor(76, 255, 165), QColor(76, 255, 165))
         self.setAttribute(Qt.WA_DeleteOnClose)
         self._init_ui()
+        self._setup_optimization_thread()
         self._setup_signals()
         self._update_prompt_button_style()
 
@@ -238,7 +346,7 @@ class SubtitleOptimizationInterface(QWidget):
         设置字幕表格，包含字幕内容的显示和编辑
         """
         self.subtitle_table = TableView(self)
-        self.model = SubtitleTableModel("")
+        self.model = SubtitleTableModel({})
         self.subtitle_table.setModel(self.model)
         self.subtitle_table.setBorderVisible(True)
         self.subtitle_table.setBorderRadius(8)
@@ -249,11 +357,16 @@ class SubtitleOptimizationInterface(QWidget):
         self.subtitle_table.setColumnWidth(0, 120)
         self.subtitle_table.setColumnWidth(1, 120)
         self.subtitle_table.verticalHeader().setDefaultSectionSize(50)
+        self.subtitle_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.subtitle_table.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed)
         self.subtitle_table.clicked.connect(self.on_subtitle_clicked)
         # 添加右键菜单支持
         self.subtitle_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.subtitle_table.customContextMenuRequested.connect(self.show_context_menu)
+        # Ctrl+M 合并选中行，只在表格获得焦点时触发
+        self.merge_shortcut = QShortcut(QKeySequence("Ctrl+M"), self.subtitle_table)
+        self.merge_shortcut.setContext(Qt.WidgetShortcut)
+        self.merge_shortcut.activated.connect(self._on_merge_shortcut)
         self.main_layout.addWidget(self.subtitle_table)
 
     def _setup_bottom_layout(self):
@@ -284,6 +397,26 @@ class SubtitleOptimizationInterface(QWidget):
         # 将底部布局添加到主布局中
         self.main_layout.addLayout(self.bottom_layout)
 
+    def _setup_optimization_thread(self):
+        """
+        创建字幕优化线程并连接信号
+
+        线程在各次处理之间复用，信号只需连接一次。
+        """
+        self.subtitle_optimization_thread = SubtitleOptimizationThread()
+        # 连接优化完成信号到相应的处理方法
+        self.subtitle_optimization_thread.finished.connect(self.on_subtitle_optimization_finished)
+        # 连接优化进度信号到相应的处理方法
+        self.subtitle_optimization_thread.progress.connect(self.on_subtitle_optimization_progress)
+        # 连接更新数据信号到相应的处理方法
+        self.subtitle_optimization_thread.update.connect(self.update_data)
+        # 连接更新所有数据信号到相应的处理方法
+        self.subtitle_optimization_thread.update_all.connect(self.update_all)
+        # 连接优化错误信号到相应的处理方法
+        self.subtitle_optimization_thread.error.connect(self.on_subtitle_optimization_error)
+        # 连接取消完成信号到相应的处理方法
+        self.subtitle_optimization_thread.cancelled.connect(self.on_subtitle_optimization_cancelled)
+
     def _setup_signals(self):
         """
         设置信号连接
@@ -319,12 +452,15 @@ class SubtitleOptimizationInterface(QWidget):
         """
         显示提示对话框
 
-        该方法创建一个 PromptDialog 对话框，并在用户点击确定后更新自定义提示文本。
+        该方法显示 PromptDialog 对话框，并在用户点击确定后更新自定义提示文本。
+        对话框只在首次打开时创建，之后复用并重新载入当前的提示文本。
         """
-        # 创建一个提示对话框
-        dialog = PromptDialog(self)
+        if self._prompt_dialog is None:
+            self._prompt_dialog = PromptDialog(self)
+        else:
+            self._prompt_dialog.load_prompt()
         # 执行对话框，如果用户点击确定
-        if dialog.exec_():
+        if self._prompt_dialog.exec_():
             # 更新自定义提示文本
             self.custom_prompt_text = cfg.custom_prompt_text.value
             # 更新提示按钮的样式
@@ -338,10 +474,8 @@ class SubtitleOptimizationInterface(QWidget):
         """
         # 如果自定义提示文本不为空
         if self.custom_prompt_text.strip():
-            # 创建一个绿色的文档图标
-            green_icon = FIF.DOCUMENT.colored(QColor(76,255,165), QColor(76,255,165))
             # 设置提示按钮的图标为绿色文档图标
-            self.prompt_button.setIcon(green_icon)
+            self.prompt_button.setIcon(self._green_doc_icon)
         else:
             # 设置提示按钮的图标为默认的文档图标
             self.prompt_button.setIcon(FIF.DOCUMENT)
@@ -386,9 +520,19 @@ class SubtitleOptimizationInterface(QWidget):
         参数:
             task: 要设置的任务对象。
         """
-        # 如果已经存在字幕优化线程，停止它
-        if hasattr(self, 'subtitle_optimization_thread'):
+        # 丢弃仍在后台解析的文件，避免其结果覆盖新任务
+        self._loading_file = None
+        self._auto_start = False
+        self._notify_loaded = False
+        # 如果字幕优化线程正在运行，停止它
+        if self.subtitle_optimization_thread.isRunning():
             self.subtitle_optimization_thread.stop()
+            self._drop_stale_thread_events()
+            # 丢弃旧任务尚未写入的流式更新
+            self._update_timer.stop()
+            self._pending_updates = {}
+            # 停止时不会收到 cancelled 信号，在这里恢复界面
+            self.on_worker_finished()
         # 启用开始按钮和文件选择按钮
         self.start_button.setEnabled(True)
         self.file_select_button.setEnabled(True)
@@ -397,16 +541,27 @@ class SubtitleOptimizationInterface(QWidget):
         # 更新任务信息
         self.update_info(task)
 
+    def _drop_stale_thread_events(self):
+        """
+        丢弃已停止任务在停止前排队、尚未送达的信号
+
+        线程已退出，旧任务的信号都已投递到事件队列中。立即派发并在各槽函数中忽略，
+        避免它们在线程复用后被当作新任务的进度、字幕更新或完成事件处理。
+        """
+        self._dropping_stale_events = True
+        try:
+            QCoreApplication.sendPostedEvents(None, QEvent.MetaCall)
+        finally:
+            self._dropping_stale_events = False
+
     def update_info(self, task: Task):
         """更新页面信息"""
         # 将任务的原始字幕保存路径转换为 Path 对象
         original_subtitle_save_path = Path(self.task.original_subtitle_save_path)
         # 从字幕文件中读取数据
         asr_data = from_subtitle_file(original_subtitle_save_path)
-        # 将读取的数据转换为 JSON 格式并保存到模型中
-        self.model._data = asr_data.to_json()
-        # 发射布局更改信号
-        self.model.layoutChanged.emit()
+        # 更新到模型中
+        self.model.set_asr_data(asr_data)
         # 更新状态标签文本
         self.status_label.setText(self.tr("已加载文件"))
 
@@ -423,6 +578,27 @@ class SubtitleOptimizationInterface(QWidget):
             )
             return
 
+        thread = self.subtitle_optimization_thread
+        if thread.isRunning():
+            # 上一个任务尚未结束，不在界面线程中等待整个任务
+            if self._run_active:
+                InfoBar.warning(
+                    self.tr("警告"),
+                    self.tr("正在优化字幕，请等待完成或取消"),
+                    duration=3000,
+                    parent=self
+                )
+                return
+            # 已收到结束信号，run() 只差返回，短暂等待；仍未退出则稍后重试
+            if not thread.wait(200):
+                QTimer.singleShot(100, self.process)
+                return
+
+        # 丢弃仍在后台解析的文件，避免其结果替换正在处理的任务
+        self._loading_file = None
+        self._auto_start = False
+        self._notify_loaded = False
+        self._run_active = True
         # 禁用开始按钮和文件选择按钮
         self.start_button.setEnabled(False)
         self.file_select_button.setEnabled(False)
@@ -432,25 +608,19 @@ class SubtitleOptimizationInterface(QWidget):
         self.cancel_button.show()
         # 更新任务配置
         self._update_task_config()
+        # 流式更新期间关闭自动换行，减少表格重绘时的文本排版开销
+        self.subtitle_table.setWordWrap(False)
 
-        # 创建字幕优化线程
-        self.subtitle_optimization_thread = SubtitleOptimizationThread(self.task)
-        # 连接优化完成信号到相应的处理方法
-        self.subtitle_optimization_thread.finished.connect(self.on_subtitle_optimization_finished)
-        # 连接优化进度信号到相应的处理方法
-        self.subtitle_optimization_thread.progress.connect(self.on_subtitle_optimization_progress)
-        # 连接更新数据信号到相应的处理方法
-        self.subtitle_optimization_thread.update.connect(self.update_data)
-        # 连接更新所有数据信号到相应的处理方法
-        self.subtitle_optimization_thread.update_all.connect(self.update_all)
-        # 连接优化错误信号到相应的处理方法
-        self.subtitle_optimization_thread.error.connect(self.on_subtitle_optimization_error)
+        # 复用字幕优化线程处理当前任务
+        self.subtitle_optimization_thread.set_task(self.task)
         # 设置自定义提示文本
         self.subtitle_optimization_thread.set_custom_prompt_text(self.custom_prompt_text)
         # 启动线程
         self.subtitle_optimization_thread.start()
         # 显示优化开始信息
         InfoBar.info(self.tr("开始优化"), self.tr("开始优化字幕"), duration=3000, parent=self)
+        # 批量处理时在优化当前文件的同时解析下一个文件
+        self._prefetch_next_file()
 
     def _update_task_config(self):
         """更新任务配置"""
@@ -481,37 +651,73 @@ class SubtitleOptimizationInterface(QWidget):
 
     def on_subtitle_optimization_finished(self, task: Task):
         """处理字幕优化完成事件"""
-        # 启用开始按钮和文件选择按钮
-        self.start_button.setEnabled(True)
-        self.file_select_button.setEnabled(True)
-        # 隐藏取消按钮
-        self.cancel_button.hide()
+        if self._dropping_stale_events:
+            return
+        self._flush_updates()
+        self.on_worker_finished()
         # 如果任务状态为待处理，发射完成信号
         if self.task.status == Task.Status.PENDING:
             self.finished.emit(task)
-        # 显示优化完成信息
-        InfoBar.success(
-            self.tr("优化完成"),
-            self.tr("优化完成字幕..."),
-            duration=3000,
-            position=InfoBarPosition.BOTTOM,
-            parent=self.parent()
-        )
         #改start
         if self.file_queue:
-            self._process_next_file()
-            self.process()  # 调用处理逻辑
-
+            # 批量处理中途只更新状态，避免每个文件都弹出提示
+            self.status_label.setText(self.tr("优化完成，剩余 {} 个文件").format(len(self.file_queue)))
+            # 加载完成后自动调用处理逻辑
+            self._process_next_file(auto_start=True)
+        else:
+            # 显示优化完成信息
+            InfoBar.success(
+                self.tr("优化完成"),
+                self.tr("优化完成字幕..."),
+                duration=3000,
+                position=InfoBarPosition.BOTTOM,
+                parent=self.parent()
+            )
         #改end
 
 
-    def on_subtitle_optimization_error(self, error):
-        """处理字幕优化错误事件"""
+    def on_worker_finished(self):
+        """优化线程结束（完成、失败或取消）后恢复界面"""
+        self._run_active = False
         # 启用开始按钮和文件选择按钮
         self.start_button.setEnabled(True)
         self.file_select_button.setEnabled(True)
         # 隐藏取消按钮
         self.cancel_button.hide()
+        self.cancel_button.setEnabled(True)
+        self.subtitle_table.setWordWrap(True)
+
+    def on_subtitle_optimization_cancelled(self):
+        """优化线程响应取消请求后退出"""
+        if self._dropping_stale_events:
+            return
+        # 丢弃取消前尚未写入的流式更新
+        self._update_timer.stop()
+        self._pending_updates = {}
+        # 按钮、进度条和状态标签一起变化，合并为一次重绘
+        self.setUpdatesEnabled(False)
+        self.on_worker_finished()
+        self.progress_bar.setValue(0)
+        self.status_label.setText(self._cancelled_status)
+        self.setUpdatesEnabled(True)
+        # 上一个取消提示还在显示时不再叠加新的提示
+        if self._cancel_infobar is None:
+            self._cancel_infobar = InfoBar.warning(
+                self._cancelled_title,
+                self._cancelled_content,
+                duration=3000,
+                parent=self
+            )
+            self._cancel_infobar.closedSignal.connect(self._on_cancel_infobar_closed)
+
+    def _on_cancel_infobar_closed(self):
+        self._cancel_infobar = None
+
+    def on_subtitle_optimization_error(self, error):
+        """处理字幕优化错误事件"""
+        if self._dropping_stale_events:
+            return
+        self.on_worker_finished()
         # 进度条显示错误状态
         self.progress_bar.error()
         # 显示优化错误信息
@@ -519,16 +725,36 @@ class SubtitleOptimizationInterface(QWidget):
 
     def on_subtitle_optimization_progress(self, value, status):
         """处理字幕优化进度事件"""
+        if self._dropping_stale_events:
+            return
         # 更新进度条的值
         self.progress_bar.setValue(value)
-        # 更新状态标签的文本
-        self.status_label.setText(status)
+        # 状态文本变化时才更新标签
+        if status != self.status_label.text():
+            self.status_label.setText(status)
 
 
     def update_data(self, data):
-        self.model.update_data(data)
+        if self._dropping_stale_events:
+            return
+        self._pending_updates.update(data)
+        # 定时器运行中不重新计时，保证持续流式输出时也能按时刷新
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _flush_updates(self):
+        """将缓存的流式更新一次性写入模型"""
+        self._update_timer.stop()
+        if self._pending_updates:
+            self.model.update_data(self._pending_updates)
+            self._pending_updates = {}
 
     def update_all(self, data):
+        if self._dropping_stale_events:
+            return
+        # 整体刷新会覆盖尚未写入的流式更新
+        self._update_timer.stop()
+        self._pending_updates = {}
         self.model.update_all(data)
 
     def remove_widget(self):
@@ -555,8 +781,7 @@ class SubtitleOptimizationInterface(QWidget):
         - 加载字幕文件：如果用户选择了一个文件，调用 load_subtitle_file 方法加载这个文件。
         """
         # 构建文件过滤器
-        subtitle_formats = " ".join(f"*.{fmt.value}" for fmt in SupportedSubtitleFormats)
-        filter_str = f"{self.tr('字幕文件')} ({subtitle_formats})"
+        filter_str = f"{self.tr('字幕文件')} ({self._SUBTITLE_FILTER})"
         # # 修改mark s
         # file_paths, _ = QFileDialog.getOpenFileNames(self, self.tr("选择字幕文件"), "", filter_str)
         # if file_paths:
@@ -571,34 +796,44 @@ class SubtitleOptimizationInterface(QWidget):
         else:
             open_path = QStandardPaths.writableLocation(QStandardPaths.DesktopLocation)
         
-        file_dialog = QFileDialog()
+        # 使用非模态对话框，避免嵌套事件循环阻塞流式更新的重绘
+        file_dialog = self._create_file_dialog(self.tr("选择字幕文件"), open_path, filter_str)
         file_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
-        file_path, _ = file_dialog.getOpenFileName(self, self.tr("选择字幕文件"), open_path , filter_str)
-        if file_path:
-            # Save this file's directory for later use
-            file_dir = str( Path(file_path).parent )
-            if file_dir != cfg.last_open_dir.value:
-                cfg.last_open_dir.value = file_dir
+        file_dialog.fileSelected.connect(self._on_subtitle_file_selected)
+        file_dialog.open()
 
-            self.file_select_button.setProperty("selected_file", file_path)
-            self.load_subtitle_file(file_path)
-            # print(file_path)
+    def _create_file_dialog(self, caption, directory, filter_str):
+        """创建关闭后自动释放的文件对话框"""
+        file_dialog = QFileDialog(self, caption, directory, filter_str)
+        file_dialog.setAttribute(Qt.WA_DeleteOnClose)
+        return file_dialog
+
+    def _on_subtitle_file_selected(self, file_path):
+        """文件选择对话框选中字幕文件"""
+        if not file_path:
+            return
+        # Save this file's directory for later use
+        file_dir = str( Path(file_path).parent )
+        if file_dir != cfg.last_open_dir.value:
+            cfg.last_open_dir.value = file_dir
+
+        self.file_select_button.setProperty("selected_file", file_path)
+        self.load_subtitle_file(file_path)
 
     #改start
     def on_batch_file_select(self):
         """
         处理批量文件选择按钮的点击事件
 
-        当用户点击批量文件选择按钮时，此方法会被调用。它会打开一个文件对话框，
-        让用户选择多个字幕文件。如果用户选择了多个文件，它会将这些文件路径设置
-        到批量文件选择按钮的属性中，并加载这些字幕文件。
+        当用户点击批量文件选择按钮时，此方法会被调用。它会打开一个非模态的文件对话框，
+        让用户选择多个字幕文件，选择结果由 _on_batch_files_selected 处理。
 
         注释：
         - 构建文件过滤器：使用 SupportedSubtitleFormats 中的值构建一个文件过滤器，
           只显示支持的字幕文件格式。
-        - 获取文件路径：使用 QFileDialog.getOpenFileNames 方法打开文件对话框，
-          并获取用户选择的文件路径。
-        - 加载字幕文件：如果用户选择了多个文件，调用 load_subtitle_file 方法加载这些文件。
+        - 打开文件对话框：以 open() 非模态方式打开，不阻塞事件循环，
+          对话框的 filesSelected 信号连接到 _on_batch_files_selected。
+        - 加载字幕文件：_on_batch_files_selected 将选中的文件加入队列，并开始处理第一个文件。
         """
         # Batch processing only for people with their own API key.
         if cfg.api_key.value == "" or cfg.api_base.value == "":
@@ -610,24 +845,60 @@ class SubtitleOptimizationInterface(QWidget):
             return
 
         # 构建文件过滤器
-        subtitle_formats = " ".join(f"*.{fmt.value}" for fmt in SupportedSubtitleFormats)
-        filter_str = f"{self.tr('字幕文件')} ({subtitle_formats})"
-        file_paths, _ = QFileDialog.getOpenFileNames(self, self.tr("选择字幕文件"), "", filter_str)
+        filter_str = f"{self.tr('字幕文件')} ({self._SUBTITLE_FILTER})"
+        file_dialog = self._create_file_dialog(self.tr("选择字幕文件"), "", filter_str)
+        file_dialog.setFileMode(QFileDialog.FileMode.ExistingFiles)
+        file_dialog.filesSelected.connect(self._on_batch_files_selected)
+        file_dialog.open()
+
+    def _on_batch_files_selected(self, file_paths):
+        """文件选择对话框选中批量字幕文件"""
         if file_paths:
-            # for file_path in file_paths:
-            #     self.file_select_button.setProperty("selected_file", file_path)
-            #     self.load_subtitle_file(file_path)
-            #     self.process()
-            
             self.file_queue.extend(file_paths)  # 将文件路径加入队列
             self._process_next_file()  # 开始处理队列中的第一个文件
 
-    def _process_next_file(self):
+    def _process_next_file(self, auto_start=False):
         """处理队列中的下一个文件"""
         if not self.file_queue:  # 如果队列为空
             return
         file_path = self.file_queue.popleft()  # 从队列中取出一个文件路径
-        self.load_subtitle_file(file_path)  # 加载文件
+        if file_path in self._prefetched:
+            # 已预解析，直接使用结果
+            self._begin_loading(file_path, auto_start)
+            self._on_subtitle_loaded(file_path, self._prefetched.pop(file_path))
+        elif file_path == self._prefetching:
+            # 预解析仍在进行，完成后由 _on_prefetch_loaded 接手
+            self._begin_loading(file_path, auto_start)
+        else:
+            self.load_subtitle_file(file_path, auto_start)  # 加载文件
+
+    def _prefetch_next_file(self):
+        """在后台预解析队列中的下一个文件"""
+        if not self.file_queue or self._prefetching is not None:
+            return
+        file_path = self.file_queue[0]
+        if file_path in self._prefetched:
+            return
+        self._prefetching = file_path
+        runnable = SubtitleLoadRunnable(file_path)
+        runnable.signals.finished.connect(self._on_prefetch_loaded)
+        runnable.signals.error.connect(self._on_prefetch_error)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_prefetch_loaded(self, file_path, asr_data):
+        """预解析完成，已轮到该文件时直接加载，否则放入缓存"""
+        self._prefetching = None
+        if file_path == self._loading_file:
+            self._on_subtitle_loaded(file_path, asr_data)
+        elif self.file_queue and self.file_queue[0] == file_path:
+            self._prefetched[file_path] = asr_data
+        # 否则队列已被取消或清空，丢弃结果，避免之后复用过期的解析数据
+
+    def _on_prefetch_error(self, file_path, error):
+        """预解析失败，轮到该文件时按加载失败处理"""
+        self._prefetching = None
+        if file_path == self._loading_file:
+            self._on_subtitle_load_error(file_path, error)
 
 
     # 改end
@@ -645,20 +916,23 @@ class SubtitleOptimizationInterface(QWidget):
             return
 
         # 获取保存路径
-        # default_name = os.path.splitext(os.path.basename(self.task.original_subtitle_save_path))[0]
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
+        file_dialog = self._create_file_dialog(
             self.tr("保存字幕文件"),
-            # default_name,  # 使用原文件名作为默认名
             self.task.original_subtitle_save_path,  # Use original name and path as default
             f"{self.tr('字幕文件')} (*.{self.format_combobox.currentText()})"
         )
-        if not file_path:
+        file_dialog.setAcceptMode(QFileDialog.AcceptSave)
+        file_dialog.fileSelected.connect(self._save_subtitle_to)
+        file_dialog.open()
+
+    def _save_subtitle_to(self, file_path):
+        """保存对话框确认后写出字幕文件"""
+        if not file_path or not self.task:
             return
 
         try:
             # 转换并保存字幕
-            asr_data = from_json(self.model._data)
+            asr_data = self.model.to_asr_data()
             layout = cfg.subtitle_layout.value
 
             if file_path.endswith(".ass"):
@@ -691,25 +965,75 @@ class SubtitleOptimizationInterface(QWidget):
         else:  # Linux
             subprocess.run(["xdg-open", os.path.dirname(self.task.original_subtitle_save_path)])
 
-    def load_subtitle_file(self, file_path):
+    def load_subtitle_file(self, file_path, auto_start=False, notify=False):
         """
         加载字幕文件并更新界面
 
         参数:
             file_path: 字幕文件的路径。
+            auto_start: 加载完成后是否自动开始处理（批量翻译时使用）。
+            notify: 加载成功后是否显示导入成功提示。
 
         注释：
-        - 创建任务：根据文件路径创建一个字幕优化任务。
-        - 加载数据：从字幕文件中加载数据，并将其转换为 JSON 格式。
-        - 更新模型：将加载的数据设置到模型中，并触发布局更改信号。
-        - 更新状态标签：设置状态标签文本为“已加载文件”。
+        - 加载数据：在线程池中解析字幕文件并转换为 JSON 格式，不阻塞界面线程。
+        - 创建任务、更新模型：解析完成后在 _on_subtitle_loaded 中进行。
         """
+        self._begin_loading(file_path, auto_start, notify)
+        runnable = SubtitleLoadRunnable(file_path)
+        runnable.signals.finished.connect(self._on_subtitle_loaded)
+        runnable.signals.error.connect(self._on_subtitle_load_error)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _begin_loading(self, file_path, auto_start=False, notify=False):
+        """记录正在加载的文件，加载完成前禁止开始处理和再次选择文件"""
+        self._loading_file = file_path
+        self._auto_start = auto_start
+        self._notify_loaded = notify
+        self.start_button.setEnabled(False)
+        self.file_select_button.setEnabled(False)
+        self.status_label.setText(self.tr("正在加载文件"))
+
+    def _end_loading(self):
+        """加载结束（成功或失败），优化线程未运行时恢复按钮"""
+        self._loading_file = None
+        if not self.subtitle_optimization_thread.isRunning():
+            self.start_button.setEnabled(True)
+            self.file_select_button.setEnabled(True)
+
+    def _on_subtitle_loaded(self, file_path, asr_data):
+        """字幕文件解析完成，创建任务并更新模型"""
+        # 期间又加载了其他文件，丢弃旧结果
+        if file_path != self._loading_file:
+            return
+        self._end_loading()
         self.create_task(file_path)
-        asr_data = from_subtitle_file(file_path)
-        self.model._data = asr_data.to_json()
-        self.model.layoutChanged.emit()
+        self.model.set_asr_data(asr_data)
         self.status_label.setText(self.tr("已加载文件"))
+        if self._notify_loaded:
+            InfoBar.success(
+                self.tr("导入成功"),
+                self.tr(f"成功导入") + os.path.basename(file_path),
+                duration=3000,
+                parent=self
+            )
+        if self._auto_start:
+            self.process()
 
+    def _on_subtitle_load_error(self, file_path, error):
+        """字幕文件解析失败"""
+        if file_path != self._loading_file:
+            return
+        self._end_loading()
+        self.status_label.setText(self.tr("加载失败"))
+        InfoBar.error(
+            self.tr("加载失败"),
+            self.tr("加载字幕文件失败: ") + error,
+            duration=5000,
+            parent=self
+        )
+        # 批量处理时跳过该文件
+        if self._auto_start:
+            self._process_next_file(auto_start=True)
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         event.accept() if event.mimeData().hasUrls() else event.ignore()
@@ -723,30 +1047,24 @@ class SubtitleOptimizationInterface(QWidget):
             file_ext = os.path.splitext(file_path)[1][1:].lower()
 
             # 检查文件格式是否支持
-            supported_formats = {fmt.value for fmt in SupportedSubtitleFormats}
-            is_supported = file_ext in supported_formats
+            is_supported = file_ext in self._SUPPORTED_FORMATS
 
             if is_supported:
                 self.file_select_button.setProperty("selected_file", file_path)
-                self.load_subtitle_file(file_path)
-                InfoBar.success(
-                    self.tr("导入成功"),
-                    self.tr(f"成功导入") + os.path.basename(file_path),
-                    duration=3000,
-                    parent=self
-                )
+                # 解析成功后再提示导入成功
+                self.load_subtitle_file(file_path, notify=True)
                 break
             else:
                 InfoBar.error(
                     self.tr(f"格式错误") + file_ext,
-                    self.tr(f"支持的字幕格式:") + str(supported_formats),
+                    self.tr(f"支持的字幕格式:") + self._SUBTITLE_FILTER,
                     duration=3000,
                     parent=self
                 )
         event.accept()
 
     def closeEvent(self, event):
-        if hasattr(self, 'subtitle_optimization_thread'):
+        if self.subtitle_optimization_thread.isRunning():
             self.subtitle_optimization_thread.stop()
         super().closeEvent(event)
 
@@ -761,9 +1079,11 @@ class SubtitleOptimizationInterface(QWidget):
         from ..components.MyVideoWidget import MyVideoWidget
         self.video_player = MyVideoWidget()
         self.video_player.resize(800, 600)
+        # 预览字幕始终写入同一个临时文件
+        temp_ass_path = os.path.join(tempfile.gettempdir(), "temp_subtitle.ass")
 
         def signal_update():
-            if not self.model._data:
+            if not self.model.rowCount():
                 return
             ass_style_name = cfg.subtitle_style_name.value
             ass_style_path = SUBTITLE_STYLE_PATH / f"{ass_style_name}.txt"
@@ -771,28 +1091,53 @@ class SubtitleOptimizationInterface(QWidget):
                 subtitle_style_srt = ass_style_path.read_text(encoding="utf-8")
             else:
                 subtitle_style_srt = None
-            temp_srt_path = os.path.join(tempfile.gettempdir(), "temp_subtitle.ass")
-            asr_data = from_json(self.model._data)
-            asr_data.save(temp_srt_path, layout=cfg.subtitle_layout.value, ass_style=subtitle_style_srt)
-            signalBus.add_subtitle(temp_srt_path)
+            ass_text = self.model.to_asr_data().to_ass(subtitle_style_srt, cfg.subtitle_layout.value)
+            # 先写到旁边的文件再替换，播放器不会读到写了一半的字幕
+            tmp_path = temp_ass_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(ass_text)
+            try:
+                os.replace(tmp_path, temp_ass_path)
+            except OSError:
+                # Windows 上播放器占用字幕文件时无法替换，退回直接覆盖写入
+                with open(temp_ass_path, 'w', encoding='utf-8') as f:
+                    f.write(ass_text)
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            signalBus.add_subtitle(temp_ass_path)
 
         # 如果有字幕文件,则添加字幕
         signal_update()
 
-        signalBus.subtitle_layout_changed.connect(signal_update)
-        self.model.dataChanged.connect(signal_update)
-        self.model.layoutChanged.connect(signal_update)
+        # 字幕频繁变化时（如流式翻译）合并为一次写入，多次打开播放器时只连接一次
+        if self._subtitle_debounce is None:
+            self._subtitle_debounce = QTimer(self)
+            self._subtitle_debounce.setSingleShot(True)
+            self._subtitle_debounce.setInterval(250)
+            self._subtitle_debounce.timeout.connect(signal_update)
+
+            # 连接绑定方法，界面销毁后全局信号自动断开
+            signalBus.subtitle_layout_changed.connect(self._restart_subtitle_debounce)
+            self.model.dataChanged.connect(self._restart_subtitle_debounce)
+            self.model.layoutChanged.connect(self._restart_subtitle_debounce)
+            self.model.modelReset.connect(self._restart_subtitle_debounce)
 
         # 如果有关联的视频文件,则自动加载
-        if self.task and hasattr(self.task, 'file_path') and self.task.file_path:
+        if self.task and self.task.file_path:
             self.video_player.setVideo(QUrl.fromLocalFile(self.task.file_path))
 
         self.video_player.show()
         self.video_player.play()
 
+    def _restart_subtitle_debounce(self, *_):
+        """字幕或布局变化后重新计时（信号参数不能传给 QTimer.start(int)）"""
+        self._subtitle_debounce.start()
+
     def on_subtitle_clicked(self, index):
         row = index.row()
-        item = list(self.model._data.values())[row]
+        item = self.model._rows[row]
         start_time = item['start_time']  # 毫秒
         end_time = item['end_time'] - 50 if item['end_time'] - 50 > start_time else item['end_time']
         signalBus.play_video_segment(start_time, end_time)
@@ -801,13 +1146,8 @@ class SubtitleOptimizationInterface(QWidget):
         """显示右键菜单"""
         menu = RoundMenu(parent=self)
 
-        # 获取选中的行
-        indexes = self.subtitle_table.selectedIndexes()
-        if not indexes:
-            return
-
-        # 获取唯一的行号
-        rows = sorted(set(index.row() for index in indexes))
+        # 获取选中的行号
+        rows = self._selected_rows()
         if not rows:
             return
 
@@ -829,60 +1169,35 @@ class SubtitleOptimizationInterface(QWidget):
         # 显示菜单
         menu.exec(self.subtitle_table.viewport().mapToGlobal(pos))
 
+    def _selected_rows(self):
+        """按选区范围获取选中的行号，不为每个单元格生成索引"""
+        # 只对选区范围排序（数量远少于行数），重叠的范围在线性扫描中跳过
+        ranges = sorted((r.top(), r.bottom()) for r in self.subtitle_table.selectionModel().selection())
+        rows = []
+        for top, bottom in ranges:
+            if rows and top <= rows[-1]:
+                top = rows[-1] + 1
+            rows.extend(range(top, bottom + 1))
+        return rows
+
     def merge_selected_rows(self, rows):
         """合并选中的字幕行"""
         if not rows or len(rows) < 2:
             return
 
         # 获取选中行的数据
-        data = self.model._data
-        data_list = list(data.values())
-
-        # 获取第一行和最后一行的时间戳
-        first_row = data_list[rows[0]]
-        last_row = data_list[rows[-1]]
-        start_time = first_row['start_time']
-        end_time = last_row['end_time']
-
-        # 合并字幕内容
-        original_subtitles = []
-        translated_subtitles = []
-        for row in rows:
-            item = data_list[row]
-            original_subtitles.append(item['original_subtitle'])
-            translated_subtitles.append(item['translated_subtitle'])
-
-        merged_original = ' '.join(original_subtitles)
-        merged_translated = ' '.join(translated_subtitles)
-
-        # 创建新的合并后的字幕项
+        items = [self.model._rows[row] for row in rows]
+
+        # 创建新的合并后的字幕项，时间戳取第一行和最后一行
         merged_item = {
-            'start_time': start_time,
-            'end_time': end_time,
-            'original_subtitle': merged_original,
-            'translated_subtitle': merged_translated
+            'start_time': items[0]['start_time'],
+            'end_time': items[-1]['end_time'],
+            'original_subtitle': ' '.join(item['original_subtitle'] for item in items),
+            'translated_subtitle': ' '.join(item['translated_subtitle'] for item in items)
         }
 
-        # 获取所有需要保留的键
-        keys = list(data.keys())
-        preserved_keys = keys[:rows[0]] + keys[rows[-1]+1:]
-
-        # 创建新的数据字典
-        new_data = {}
-        for i, key in enumerate(preserved_keys):
-            if i == rows[0]:
-                new_key = f"{len(new_data)+1}"
-                new_data[new_key] = merged_item
-            new_key = f"{len(new_data)+1}"
-            new_data[new_key] = data[key]
-
-        # 如果合并的是最后几行，需要确保合并项被添加
-        if rows[0] >= len(preserved_keys):
-            new_key = f"{len(new_data)+1}"
-            new_data[new_key] = merged_item
-
-        # 更新模型数据
-        self.model.update_all(new_data)
+        # 一次性删除合并范围内多余的行，视图只刷新一次
+        self.model.merge_rows(rows[0], rows[-1], merged_item)
 
         # 显示成功提示
         InfoBar.success(
@@ -892,34 +1207,21 @@ class SubtitleOptimizationInterface(QWidget):
             parent=self
         )
 
-    def keyPressEvent(self, event):
-        """处理键盘事件"""
-        # 处理 Ctrl+M 快捷键
-        if event.modifiers() == Qt.ControlModifier and event.key() == Qt.Key_M:
-            indexes = self.subtitle_table.selectedIndexes()
-            if indexes:
-                rows = sorted(set(index.row() for index in indexes))
-                if len(rows) > 1:
-                    self.merge_selected_rows(rows)
-            event.accept()
-        else:
-            super().keyPressEvent(event)
+    def _on_merge_shortcut(self):
+        """处理 Ctrl+M 快捷键"""
+        rows = self._selected_rows()
+        if len(rows) > 1:
+            self.merge_selected_rows(rows)
 
     def cancel_optimization(self):
-        """取消字幕优化"""
-        if hasattr(self, 'subtitle_optimization_thread'):
-            self.subtitle_optimization_thread.stop()
-            self.start_button.setEnabled(True)
-            self.file_select_button.setEnabled(True)
-            self.cancel_button.hide()
-            self.progress_bar.setValue(0)
-            self.status_label.setText(self.tr("已取消优化"))
-            InfoBar.warning(
-                self.tr("已取消"),
-                self.tr("字幕优化已取消"),
-                duration=3000,
-                parent=self
-            )
+        """取消字幕优化，线程退出后在 on_subtitle_optimization_cancelled 中恢复界面"""
+        if self.subtitle_optimization_thread.isRunning():
+            # 批量处理时不再继续后续文件
+            self.file_queue.clear()
+            self._prefetched.clear()
+            self.subtitle_optimization_thread.request_cancel()
+            self.cancel_button.setEnabled(False)
+            self.status_label.setText(self._cancelling_text)
 
 
 class PromptDialog(MessageBoxBase):
@@ -938,7 +1240,7 @@ class PromptDialog(MessageBoxBase):
         self.text_edit.setPlaceholderText(
             self.tr("请输入文稿提示（优化字幕或者翻译字幕的提示参考）")
         )
-        self.text_edit.setText(cfg.custom_prompt_text.value)
+        self.load_prompt()
         
         self.text_edit.setMinimumWidth(400)
         self.text_edit.setMinimumHeight(200)
@@ -952,18 +1254,28 @@ class PromptDialog(MessageBoxBase):
         self.yesButton.setText(self.tr('确定'))
         self.cancelButton.setText(self.tr('取消'))
 
+    def load_prompt(self):
+        """从配置载入提示文本，复用对话框时丢弃上次未保存的修改"""
+        self._initial_prompt = cfg.custom_prompt_text.value
+        self.text_edit.setText(self._initial_prompt)
+
     def get_prompt(self):
         return self.text_edit.toPlainText()
 
     def save_prompt(self):
         # 在点击确定按钮时保存提示文本到配置
         prompt_text = self.text_edit.toPlainText()
-        cfg.set(cfg.custom_prompt_text, prompt_text)
-        print(cfg.custom_prompt_text.value)
+        # 文本未修改时不必重写配置文件
+        if prompt_text != self._initial_prompt:
+            cfg.set(cfg.custom_prompt_text, prompt_text)
+            self._initial_prompt = prompt_text
+            logger.debug("文稿提示已更新（%d 字）", len(prompt_text))
 
 
 if __name__ == "__main__":
-    QApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+    # 缩放取整策略需要 Qt 5.14+；Qt5 下高 DPI 缩放默认关闭，两个属性仍需显式开启
+    if hasattr(QApplication, 'setHighDpiScaleFactorRoundingPolicy'):
+        QApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
 